@@ -31,11 +31,19 @@ See end of file for performance considerations.
 
 """
 class ACCEL_WGET(object):
+
+   # static option metadata, registered once per parent in __init__.
+   options = ( 'accel_wget_command', 'accel_wget_threshold', 'accel_wget_protocol' )
+
    def __init__(self,parent):
+      import re
+
+      for option in self.options :
+          parent.declare_option( option )
 
-      parent.declare_option( 'accel_wget_command' )
-      parent.declare_option( 'accel_wget_threshold' )
-      parent.declare_option( 'accel_wget_protocol' )
+      # wget reports "... saved [NNN/NNN]" on stderr when not quiet.
+      # compiled once here; search() skips straight to the bracket.
+      self.wget_size_re = re.compile(r'\[([0-9]+)/[0-9]+\]')
 
    def on_start(self,parent):
 
@@ -53,6 +61,15 @@ class ACCEL_WGET(object):
 
       return True
 
+   @staticmethod
+   def get_size(msg):
+      # advertised size from the parts header: whole file, or chunk size
+      # times block count when partitioned.
+      parts = msg.partstr.split(',')
+      if parts[0] == '1':
+          return int(parts[1])
+      return int(parts[1])*int(parts[2])
+
    def on_message(self,parent):
       import urllib.parse
 
@@ -61,14 +78,10 @@ class ACCEL_WGET(object):
 
       if msg.headers['sum'][0] == 'L' or msg.headers['sum'][0] == 'R' : return True
 
-      parts = msg.partstr.split(',')
-      if parts[0] == '1':
-          sz=int(parts[1])
-      else:
-          sz=int(parts[1])*int(parts[2])
+      sz = self.get_size(msg)
 
-      logger.debug("wget sz: %d, threshold: %d download: %s to %s, " % ( \
-          sz, parent.accel_wget_threshold, parent.msg.urlstr, msg.new_file ) )
+      logger.debug("wget sz: %d, threshold: %d download: %s to %s, ",
+          sz, parent.accel_wget_threshold, parent.msg.urlstr, msg.new_file )
       if sz >= parent.accel_wget_threshold :
           for p in parent.accel_wget_protocol :
               parent.msg.urlstr = msg.urlstr.replace(p,"download")
@@ -80,43 +93,49 @@ class ACCEL_WGET(object):
 
 
    def do_download(self,parent):
-      import os
       import subprocess
 
       logger = parent.logger
       msg    = parent.msg
 
       msg.urlstr = msg.urlstr.replace("download:","http:")
-      os.chdir( msg.new_dir )
       cmd = parent.accel_wget_command[0].split() + [ msg.urlstr ]
-      logger.debug("wget do_download in %s invoking: %s " % ( msg.new_dir, cmd ) )
+      logger.debug("wget do_download in %s invoking: %s ", msg.new_dir, cmd )
 
-      p = subprocess.Popen(cmd)
-      p.wait()
+      # run with cwd= rather than os.chdir (process-global, races with
+      # other transfers) and capture output so wget cannot block on a
+      # full, unread pipe.
+      p = subprocess.run(cmd, cwd=msg.new_dir, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
       if p.returncode != 0:  # Failed!
+         logger.error("wget download failed: %s" % p.stderr.decode('utf-8','replace').strip())
          if parent.reportback:
              msg.report_publish(499,'wget download failed')
-         return False 
+         return False
+
+      self.check_results(parent, p.stderr.decode('utf-8','replace'))
 
       if parent.reportback:
          msg.report_publish(201,'Downloaded')
       return True
 
+   def check_results(self,parent,stderr):
+      """ compare the size wget reports on stderr against the advertised one. """
+      m = self.wget_size_re.search(stderr)
+      if m is None: return
+      sz = int(m.group(1))
+      if parent.msg.filesize and sz != parent.msg.filesize:
+         parent.logger.warning("wget downloaded %d bytes, expected %d for %s" % \
+             ( sz, parent.msg.filesize, parent.msg.new_file ) )
+
 self.plugin='ACCEL_WGET'
 
 
 """
 Caveats:
 
-     FIXME: on testing with python 3.6, if I don't re-direct to DEVNULL, it hangs.  
-     would like to see output of command in the log.
-
      This downloader invokes wget with only the remote url.
      no options about local file naming are implemented.
 
-     If you have python >= 3.5, replace 'subprocess.call' by subprocess.run, and the stout and stderr will 
-     do the right thing. For 'call' also need to change result == 0 to result.returncode == 0 .
-
 APPLICATION NOTES:
 
     - The built-in downloading logic is pretty good in almost all cases. It is rarely adviseable to use
@@ -0,0 +1,72 @@
+#!/usr/bin/python3
+
+"""
+on_heartbeat handler that records flamegraphs of a running component with the
+py-spy sampling profiler, for diagnosing hot plugins without ad-hoc
+instrumentation. Sampling keeps the overhead to a few percent, so it is safe
+to leave configured on a busy instance.
+
+usage:
+
+on_heartbeat hb_pyspy
+
+Recording only happens while the SARRA_PROFILE environment variable is set
+to 'py-spy', so the plugin can stay in a configuration permanently and be
+switched on for a single run. Each heartbeat starts one recording of
+*hb_pyspy_duration* seconds (default: 30) writing an SVG flamegraph named
+py_spy_<pid>.svg in the component's log directory; a heartbeat arriving
+while a recording is still in progress is skipped.
+
+The py-spy executable must be available on the PATH.
+
+options:
+
+hb_pyspy_duration (default: 30)
+
+  how many seconds of samples to record per heartbeat.
+
+"""
+
+import os
+import subprocess
+
+class Hb_Pyspy(object):
+
+    def __init__(self,parent):
+
+        parent.declare_option('hb_pyspy_duration')
+
+        if not hasattr(parent,'hb_pyspy_duration'):
+            parent.hb_pyspy_duration = [ '30' ]
+        self.duration = int(float(parent.hb_pyspy_duration[0]))
+        self.proc     = None
+
+    def perform(self,parent):
+        # imported here as well so the method does not depend on names
+        # leaking from the execfile frame that loads plugin scripts.
+        import os,subprocess
+
+        logger = parent.logger
+
+        if os.environ.get('SARRA_PROFILE') != 'py-spy':
+            return True
+
+        if self.proc is not None and self.proc.poll() is None:
+            logger.debug("hb_pyspy previous recording still in progress")
+            return True
+
+        svg = os.path.join(parent.user_log_dir, 'py_spy_%d.svg' % os.getpid())
+        cmd = [ 'py-spy', 'record', '-o', svg, '-d', str(self.duration), \
+                '--pid', str(os.getpid()) ]
+        try:
+            self.proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, \
+                stderr=subprocess.DEVNULL)
+            logger.info("hb_pyspy recording %d seconds of samples to %s" % \
+                ( self.duration, svg ))
+        except FileNotFoundError:
+            logger.error("hb_pyspy requires the py-spy executable on the PATH")
+
+        return True
+
+hb_pyspy = Hb_Pyspy(self)
+self.on_heartbeat = hb_pyspy.perform
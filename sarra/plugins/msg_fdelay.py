@@ -9,55 +9,64 @@
   every message will be at least 30 seconds old before it is forwarded by this plugin.
 
 """
+import os
+
 from sarra.sr_util import timestr2flt, nowstr, nowflt
 
 
 class Msg_FDelay(object):
     def __init__(self, parent):
+        import functools
+
         parent.declare_option('msg_fdelay')
-        if hasattr(parent, 'msg_fdelay') and type(parent.msg_fdelay) is list:
-            parent.msg_fdelay = int(parent.msg_fdelay[0])
-        elif not hasattr(parent, 'msg_fdelay'):
+        # upstreams often batch messages sharing the same pubTime string,
+        # so memoizing turns repeat parses into a dict lookup.
+        self.parse_pubtime = functools.lru_cache(maxsize=4096)(timestr2flt)
+        if not hasattr(parent, 'msg_fdelay'):
             parent.msg_fdelay = 60
+        else:
+            if isinstance(parent.msg_fdelay, list):
+                parent.msg_fdelay = parent.msg_fdelay[0]
+            if not isinstance(parent.msg_fdelay, (int, float)):
+                parent.msg_fdelay = int(parent.msg_fdelay)
 
-    def on_message(self, parent):
-        import os
-        import stat
+    def defer(self, parent, what, remaining):
+        # too fresh: park the message on the retry queue and slow down.
+        parent.logger.debug("%s not old enough, sleeping for %.3f seconds" % (what, remaining))
+        parent.consumer.sleep_now = parent.consumer.sleep_min
+        parent.consumer.msg_to_retry()
+        parent.msg.isRetry = False
+        return False
 
+    def on_message(self, parent):
         # Prepare msg delay test
         if parent.msg.sumflg == 'R':
             # 'R' msg will be removed by itself
             return False
 
+        # "now" does not need per-check precision, so take the clock once
+        now = nowflt()
+        fdelay = parent.msg_fdelay
+
         # Test msg delay
-        elapsedtime = nowflt() - timestr2flt(parent.msg.headers['pubTime'])
-        if elapsedtime < parent.msg_fdelay:
-            dbg_msg = "message not old enough, sleeping for {:.3f} seconds"
-            parent.logger.debug(dbg_msg.format(elapsedtime, parent.msg_fdelay - elapsedtime))
-            parent.consumer.sleep_now = parent.consumer.sleep_min
-            parent.consumer.msg_to_retry()
-            parent.msg.isRetry = False
-            return False
+        elapsedtime = now - self.parse_pubtime(parent.msg.headers['pubTime'])
+        if elapsedtime < fdelay:
+            return self.defer(parent, "message", fdelay - elapsedtime)
 
         # Prepare file delay test
         if '/cfr/' in parent.msg.new_dir:
             f = os.path.join(parent.msg.new_dir, parent.msg.new_file)
         else:
             f = parent.msg.relpath
-        if not os.path.exists(f):
+        # Test file delay (single stat call covers the existence check)
+        try:
+            filetime = os.stat(f).st_mtime
+        except FileNotFoundError:
             parent.logger.error("did not find file {}".format(f))
             return False
-
-        # Test file delay
-        filetime = os.stat(f)[stat.ST_MTIME]
-        elapsedtime = nowflt() - filetime
-        if elapsedtime < parent.msg_fdelay:
-            dbg_msg = "file not old enough, sleeping for {:.3f} seconds"
-            parent.logger.debug(dbg_msg.format(elapsedtime, parent.msg_fdelay - elapsedtime))
-            parent.consumer.sleep_now = parent.consumer.sleep_min
-            parent.consumer.msg_to_retry()
-            parent.msg.isRetry = False
-            return False
+        elapsedtime = now - filetime
+        if elapsedtime < fdelay:
+            return self.defer(parent, "file", fdelay - elapsedtime)
 
         return True
 
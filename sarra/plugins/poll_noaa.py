@@ -18,6 +18,7 @@ usage:
 	Posts the file on the exchange if the request returns a valid URL. 
 """
 
+import concurrent.futures
 import logging,urllib.request
 import xml.etree.ElementTree as ET
 
@@ -27,6 +28,7 @@ class NOAAPoller(object):
 		parent.declare_option('poll_noaa_stn_file')
 
 	def do_poll(self,parent):
+		import concurrent.futures
 		import logging,urllib.request
 		import xml.etree.ElementTree as ET
 
@@ -50,34 +52,72 @@ class NOAAPoller(object):
 
 		else:
 			# Grab station site codes from https://opendap.co-ops.nos.noaa.gov/stations/stationsXML.jsp
-			tree = ET.parse(urllib.request.urlopen\
-						('https://opendap.co-ops.nos.noaa.gov/stations/stationsXML.jsp'))
-			root = tree.getroot()
-			for child in root:
-			        sitecodes.append(child.attrib['ID'])
+			# stream-parse instead of materializing the whole tree: each
+			# station is read as its element completes and freed right away.
+			with urllib.request.urlopen\
+					('https://opendap.co-ops.nos.noaa.gov/stations/stationsXML.jsp') as f:
+				root  = None
+				depth = 0
+				for event, elem in ET.iterparse(f, events=('start','end')):
+					if event == 'start':
+						if root is None: root = elem
+						depth += 1
+						continue
+					depth -= 1
+					if depth == 1:
+						sitecodes.append(elem.attrib['ID'])
+						elem.clear()
+						root.clear()
 
-		# Every hour, form the link of water level/temp data to post
+		# Every hour, form the links of water level/temp data to post
+		links = []
 		for site in sitecodes:
 			# Water temp request
-			resp = urllib.request.urlopen(parent.destination.format(site,'water_temperature')).getcode()
-			logger.info("poll_noaa file posted: %s" % \
-					parent.destination.format(site,'water_temperature'))
-			parent.msg.new_baseurl = parent.destination.format(site,'water_temperature')
-			parent.msg.new_file = 'CO-OPS__{0}__wt.csv'.format(site)
-			parent.msg.sumflg = 'z'
-			parent.msg.sumstr = 'z,d'
-			parent.msg.set_parts()
-			parent.to_clusters = 'ALL'
-			parent.post(parent.exchange,parent.msg.new_baseurl,parent.msg.new_file,\
-					parent.to_clusters,sumstr=parent.msg.sumstr)
-		
+			links.append((parent.destination.format(site,'water_temperature'),
+					'CO-OPS__{0}__wt.csv'.format(site)))
 			# Water level request
-			resp = urllib.request.urlopen(parent.destination.format(site,'water_level')\
-							+'&datum=STND').getcode()
-			logger.info("poll_noaa file posted: %s" % \
-					parent.destination.format(site,'water_level')+'&datum=STND')
-			parent.msg.new_baseurl = parent.destination.format(site,'water_level')+'&datum=STND'
-			parent.msg.new_file = 'CO-OPS__{0}__wl.csv'.format(site)
+			links.append((parent.destination.format(site,'water_level')+'&datum=STND',
+					'CO-OPS__{0}__wl.csv'.format(site)))
+
+		# all links target the same host, so reuse pooled keep-alive
+		# connections when the requests library is available, rather
+		# than a fresh TCP+TLS handshake per link; fall back to urllib
+		# otherwise.
+		try:
+			import requests
+			session = requests.Session()
+		except ImportError:
+			session = None
+
+		# fetch returns None on success, the exception otherwise, so one
+		# failing link cannot abort the whole poll.
+		def fetch(url):
+			try:
+				if session is not None:
+					session.get(url).raise_for_status()
+				else:
+					urllib.request.urlopen(url).getcode()
+				return None
+			except Exception as e:
+				return e
+
+		# the requests are pure network latency, so issue them from a
+		# thread pool; posting stays in this thread because the AMQP
+		# channel is not thread-safe.
+		with concurrent.futures.ThreadPoolExecutor(max_workers=8) as ex:
+			outcomes = list(ex.map(fetch, [url for url, newfile in links]))
+
+		if session is not None:
+			session.close()
+
+		# only post the links whose request succeeded
+		for (url, newfile), err in zip(links, outcomes):
+			if err is not None:
+				logger.error("poll_noaa request failed, not posting %s: %s" % (url, err))
+				continue
+			logger.info("poll_noaa file posted: %s" % url)
+			parent.msg.new_baseurl = url
+			parent.msg.new_file = newfile
 			parent.msg.sumflg = 'z'
 			parent.msg.sumstr = 'z,d'
 			parent.msg.set_parts()
@@ -61,7 +61,9 @@ class sr_cfg2:
        self.directory = None
 
        if parent is None:
-          self.env = copy.deepcopy(os.environ)
+          # os.environ is a flat str->str mapping, so a plain dict copy
+          # gives an independent snapshot without recursive copying.
+          self.env = dict(os.environ)
 
        self.exchanges = []
        self.filename = None
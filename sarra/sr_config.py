@@ -72,8 +72,19 @@ except ImportError:
 if sys.hexversion > 0x03030000:
    from shutil import get_terminal_size
    py2old=False
-else: 
-   py2old=True 
+else:
+   py2old=True
+
+# log level names resolved with a single dict lookup; declaration order
+# matters, as abbreviated settings fall back to a substring match below.
+log_levels = { 'critical': logging.CRITICAL, 'error': logging.ERROR,
+               'warning': logging.WARNING, 'info': logging.INFO,
+               'debug': logging.DEBUG, 'none': logging.NOTSET }
+
+# cache of compiled plugin scripts, keyed on script path.
+# plugins are re-installed many times within a process (per configuration,
+# on reloads) so skip the read+compile steps when the script is unchanged.
+plugin_script_cache = {}
 
 
 class StdFileLogWrapper(io.TextIOWrapper):
@@ -654,7 +665,9 @@ class sr_config:
 
     def declare_option(self,option):
         self.logger.debug("sr_config declare_option")
-        self.known_options.append(option)
+        # plugins may be instantiated more than once; register each option once.
+        if option not in self.known_options :
+           self.known_options.append(option)
 
     def defaults(self):
         self.logger.debug("sr_config defaults")
@@ -891,6 +904,10 @@ class sr_config:
             exec( 'self.'+t+' = None' )
             exec( 'self.'+t+'_list = [ ]' )
 
+        # (opname,script) pairs already installed, so that a plugin listed
+        # twice does not have its callbacks appended twice.
+        self.plugins_installed = set()
+
         #self.execfile("on_message","log_all")
 
         self.execfile("on_file",'file_log')
@@ -951,24 +968,38 @@ class sr_config:
         """
            Add plugins, returning True on Success.
         """
-        setattr(self,opname,None)
-
         if path == 'None' or path == 'none' or path == 'off':
-             self.logger.debug("Reset plugin %s to None" % opname ) 
+             self.logger.debug("Reset plugin %s to None" % opname )
+             setattr(self,opname,None)
              exec( 'self.' + opname + '_list = [ ]' )
+             self.plugins_installed = set( t for t in self.plugins_installed if t[0] != opname )
              return True
 
         ok,script = self.config_path('plugins',path,mandatory=True,ctype='py')
         if ok:
-            self.logger.debug("installing %s plugin %s" % (opname, script ) ) 
+            self.logger.debug("installing %s plugin %s" % (opname, script ) )
         else:
-            self.logger.error("installing %s plugin %s failed: not found " % (opname, path) ) 
+            self.logger.error("installing %s plugin %s failed: not found " % (opname, path) )
+            setattr(self,opname,None)
             return False
 
+        if (opname,script) in self.plugins_installed:
+            self.logger.debug("%s plugin %s already installed" % (opname, path) )
+            return True
+
+        setattr(self,opname,None)
+
         self.logger.debug('installing: %s plugin %s' % ( opname, path ) )
         try:
-            with open(script) as f:
-                exec(compile(f.read(), script, 'exec'))
+            mtime  = os.path.getmtime(script)
+            cached = plugin_script_cache.get(script)
+            if cached and cached[0] == mtime:
+                code = cached[1]
+            else:
+                with open(script) as f:
+                    code = compile(f.read(), script, 'exec')
+                plugin_script_cache[script] = (mtime, code)
+            exec(code)
         except:
             self.logger.error("sr_config/execfile 2 failed for option '%s' and plugin '%s'" % (opname, path))
             self.logger.debug('Exception details: ', exc_info=True)
@@ -989,6 +1020,8 @@ class sr_config:
         else:
             eval( 'self.' + opname + '_list.append(self.' + opname + ')' )
 
+        self.plugins_installed.add( (opname,script) )
+
         return True
 
     def find_file_in_dir(self,d,name,recursive=False):
@@ -2126,18 +2159,14 @@ class sr_config:
 
                 elif words0 in ['loglevel', 'll']:  # See: sr_config.7
                      level = words1.lower()
-                     if level in 'critical':
-                         self.loglevel = logging.CRITICAL
-                     elif level in 'error':
-                         self.loglevel = logging.ERROR
-                     elif level in 'warning':
-                         self.loglevel = logging.WARNING
-                     elif level in 'info':
-                         self.loglevel = logging.INFO
-                     elif level in 'debug':
-                         self.loglevel = logging.DEBUG
-                     elif level in 'none':
-                         self.loglevel = logging.NOTSET
+                     if level in log_levels:
+                         self.loglevel = log_levels[level]
+                     else:
+                         # abbreviated settings match a substring of the name
+                         for name in log_levels:
+                             if level in name:
+                                 self.loglevel = log_levels[name]
+                                 break
                      n = 2
 
                 elif words0 in ['manager','feeder'] : # See: sr_config.7, sr_sarra.8
@@ -2804,6 +2833,17 @@ class sr_config:
 
     def setlog(self, interactive=False):
         base_log_format = '%(asctime)s [%(levelname)s] %(message)s'
+
+        # repeat calls with the same destination and level are no-ops,
+        # skipping the handler teardown and reconfiguration below.
+        # logpath does not exist yet on the first, interactive call.
+        logpath   = getattr(self,'logpath',None)
+        logconfig = (interactive or not logpath, logpath, self.loglevel)
+        if getattr(self,'logconfig',None) == logconfig:
+            self.logger = logging.getLogger()
+            return
+        self.logconfig = logconfig
+
         if logging.getLogger().hasHandlers():
             for h in logging.getLogger().handlers:
                 h.close()
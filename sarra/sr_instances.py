@@ -51,6 +51,10 @@ except :
 
 class sr_instances(sr_config):
 
+    # actions dispatched as sets rather than if/elif name ladders.
+    actions_on_all    = frozenset(('list','restart','reload','start','stop','status','sanity'))
+    actions_on_config = frozenset(('add','disable','edit','enable','list','remove','rename'))
+
     def __init__(self,config=None,args=None,action=None):
         signal.signal(signal.SIGTERM, self.stop_signal)
         signal.signal(signal.SIGINT, self.stop_signal)
@@ -268,13 +272,8 @@ class sr_instances(sr_config):
         # No config provided
 
         if self.config_name == None:
-           if   action == 'list'     : self.exec_action_on_all(action)
-           elif action == 'restart'  : self.exec_action_on_all(action)
-           elif action == 'reload'   : self.exec_action_on_all(action)
-           elif action == 'start'    : self.exec_action_on_all(action)
-           elif action == 'stop'     : self.exec_action_on_all(action)
-           elif action == 'status'   : self.exec_action_on_all(action)
-           elif action == 'sanity'   : self.exec_action_on_all(action)
+           if action in self.actions_on_all :
+                self.exec_action_on_all(action)
            else :
                 self.logger.warning("Should invoke 4: %s [args] action config" % sys.argv[0])
            os._exit(0)
@@ -282,13 +281,8 @@ class sr_instances(sr_config):
         # Config provided was not a config (i.e. ".conf' file in usr_config_dir)
 
         if not self.config_found :
-           if   action == 'add'      : self.exec_action_on_config(action)
-           elif action == 'disable'  : self.exec_action_on_config(action)
-           elif action == 'edit'     : self.exec_action_on_config(action)
-           elif action == 'enable'   : self.exec_action_on_config(action)
-           elif action == 'list'     : self.exec_action_on_config(action)
-           elif action == 'remove'   : self.exec_action_on_config(action)
-           elif action == 'rename'   : self.exec_action_on_config(action)
+           if action in self.actions_on_config :
+                self.exec_action_on_config(action)
            else :
                 self.logger.warning("Should invoke 5: %s [args] action config" % sys.argv[0])
            os._exit(0)
@@ -301,7 +295,7 @@ class sr_instances(sr_config):
         elif action == 'start'      : self.start_parent()
         elif action == 'stop'       : self.stop_parent()
         elif action == 'status'     : self.status_parent()
-        elif action == 'sanity'     : 
+        elif action == 'sanity'     :
                                       self.status_parent(sanity=True)
                                       self.log_age_parent()
 
@@ -310,14 +304,8 @@ class sr_instances(sr_config):
         elif action == 'declare'    : self.declare()
         elif action == 'setup'      : self.setup()
 
-        elif action == 'add'        : self.exec_action_on_config(action)
-        elif action == 'disable'    : self.exec_action_on_config(action)
-        elif action == 'edit'       : self.exec_action_on_config(action)
-        elif action == 'enable'     : self.exec_action_on_config(action)
-        elif action == 'list'       : self.exec_action_on_config(action)
-        elif action == 'log'        : self.exec_action_on_config(action)
-        elif action == 'remove'     : self.exec_action_on_config(action)
-        elif action == 'rename'     : self.exec_action_on_config(action)
+        elif action == 'log' or action in self.actions_on_config :
+                                      self.exec_action_on_config(action)
 
         else :
            self.logger.error("action unknown %s" % action)
@@ -43,6 +43,15 @@ import json
 # AMQP limits headers to 'short string', or 255 characters, so truncate and warn.
 amqp_ss_maxlen = 253
 
+from types import MappingProxyType
+
+# v02<->v03 translation tables, consulted once per converted message, so
+# built a single time and frozen against accidental mutation.
+parts_method_map = MappingProxyType({'i': 'inplace', 'p': 'partitioned'})
+parts_flag_map   = MappingProxyType({'inplace': 'i', 'partitioned': 'p'})
+sum_algo_map     = MappingProxyType({ "a":"arbitrary", "d":"md5", "s":"sha512", "n":"md5name", \
+                                      "0":"random", "L":"link", "R":"remove", "z":"cod" })
+
 from base64 import b64decode, b64encode
 from mimetypes import guess_type
 
@@ -130,7 +139,7 @@ class sr_message():
 
     def __print_json( self ):
 
-        if not self.topic.split('.')[1] in [ 'post', 'report' ]:
+        if not self.topic.split('.')[1] in { 'post', 'report' }:
             return
 
         if self.post_version == 'v03':
@@ -195,7 +204,7 @@ class sr_message():
             else:
                self.logger.debug("sr_csnbd {} new version is {} newer (new: {} vs old: {} )".format(fname, new_mtime-old_mtime, new_mtime, old_mtime ))
 
-        if self.sumflg in [ '0', 'n', 'z'] : 
+        if self.sumflg in { '0', 'n', 'z'} : 
             self.logger.debug("sr_csnbd content_match %s sum 0/n/z never matches" % (fname ) )
             return False
  
@@ -259,9 +268,9 @@ class sr_message():
 
     def convert_partsv2tov3(self):
         self.headers['size'] = self.length
-        if self.partflg not in ['0', '1']:
+        if self.partflg not in {'0', '1'}:
             self.headers['blocks'] = {}
-            self.headers['blocks']['method'] = {'i': 'inplace', 'p': 'partitioned'}[self.partflg]
+            self.headers['blocks']['method'] = parts_method_map[self.partflg]
             self.headers['blocks']['size'] = str(self.chunksize)
             self.headers['blocks']['count'] = str(self.block_count)
             self.headers['blocks']['remainder'] = str(self.remainder)
@@ -318,8 +327,7 @@ class sr_message():
                    self.sumstr = self.headers['sum']
                    del self.headers['integrity']
                if 'blocks' in self.headers.keys():
-                   parts_map = {'inplace': 'i', 'partitioned': 'p'}
-                   self.set_parts(parts_map[self.headers['blocks']['method']], int(self.headers['blocks']['size']),
+                   self.set_parts(parts_flag_map[self.headers['blocks']['method']], int(self.headers['blocks']['size']),
                                       int(self.headers['blocks']['count']), int(self.headers['blocks']['remainder']),
                                       int(self.headers['blocks']['number']))
                    del self.headers['blocks']
@@ -538,7 +546,7 @@ class sr_message():
            if 'content' in self.headers :
                del self.headers['content']
 
-        elif ( self.headers[ 'sum' ][0] in [ 'L', 'R' ] ) :
+        elif ( self.headers[ 'sum' ][0] in { 'L', 'R' } ) :
             # avoid inlining if it is a link or a remove.
             pass
         elif ( self.post_version == 'v03' ) and ( 'post' in self.post_topic_prefix ) \
@@ -604,7 +612,7 @@ class sr_message():
         # TODO investigate as this would throw a TypeError if post_exchange_split is None
         if self.post_exchange_split > 0 :
            if 'integrity' in self.headers : 
-               if self.headers['integrity']['method'] in ['cod','random']:
+               if self.headers['integrity']['method'] in {'cod','random'}:
                    suffix= "%02d" % ( sum( bytearray(self.headers['integrity']['value'], 'ascii')) % self.post_exchange_split )
                    self.logger.debug( "post_exchange_split set, keying on %s , suffix is %s" % \
                         ( self.headers['sum']['value'], suffix) )
@@ -628,7 +636,6 @@ class sr_message():
                self.headers[ "baseUrl" ] = self.baseurl
                self.headers[ "relPath" ] = self.relpath
                
-               sum_algo_map = { "a":"arbitrary", "d":"md5", "s":"sha512", "n":"md5name", "0":"random", "L":"link", "R":"remove", "z":"cod" }
                if 'sum' in self.headers:
                    sm = sum_algo_map[ self.headers["sum"][0] ]
                    if sm in [ 'random' ] :